@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Delivery Channels
+Pluggable channels (Telegram, webhook, email, file/stdout) for plant watering
+reminders, each with its own formatter, dispatched concurrently under one deadline.
+"""
+
+import json
+import os
+import re
+import smtplib
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
+from email.message import EmailMessage
+from typing import Optional, Dict, Any, List, Callable
+
+import requests
+
+DEFAULT_DEADLINE_SECONDS = 10.0
+EMAIL_SUBJECT = "🌱 Plant Watering Reminders"
+
+Formatter = Callable[[Dict[str, Any]], Any]
+
+
+class DeliveryError(Exception):
+    """Raised by a channel when its reminder could not be delivered."""
+
+
+def plain_text(reminder: Dict[str, Any]) -> str:
+    """Format a reminder as plain text by stripping the Telegram Markdown markers."""
+    return re.sub(r"\*+", "", reminder["message"])
+
+
+def _plant_summary(plants: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reduce plant entries to the id, name and location sent to webhooks."""
+    return [{"id": p.get("id"), "name": p.get("name"), "location": p.get("location")} for p in plants]
+
+
+def json_payload(reminder: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a reminder as a structured JSON document for webhooks."""
+    return {
+        "type": "watering_reminder",
+        "season": reminder.get("season"),
+        "text": plain_text(reminder),
+        "overdue": _plant_summary(reminder.get("overdue", [])),
+        "due_today": _plant_summary(reminder.get("due_today", [])),
+        "upcoming": _plant_summary(reminder.get("upcoming", []))
+    }
+
+
+class DeliveryChannel(ABC):
+    """
+    Base class for a reminder delivery channel.
+
+    Subclasses implement `send`, which receives the formatted payload and
+    returns a small dict describing the delivery (or raises DeliveryError).
+    """
+
+    name = "channel"
+
+    def __init__(self, formatter: Optional[Formatter] = None, name: Optional[str] = None):
+        """
+        Args:
+            formatter: Callable turning a reminder dict into this channel's payload
+            name (str): Label used in logs, defaults to the channel type
+        """
+        self.formatter = formatter or self.default_formatter
+        if name:
+            self.name = name
+
+    def default_formatter(self, reminder: Dict[str, Any]) -> Any:
+        """Formatter used when none is given: the reminder as plain text."""
+        return plain_text(reminder)
+
+    @abstractmethod
+    def send(self, payload: Any, timeout: float) -> Dict[str, Any]:
+        """Send a formatted payload, raising DeliveryError if it isn't delivered."""
+
+    def deliver(self, reminder: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Format and send a reminder."""
+        return self.send(self.formatter(reminder), timeout)
+
+
+class TelegramChannel(DeliveryChannel):
+    """Sends reminders with the Telegram Bot API sendMessage method."""
+
+    name = "telegram"
+
+    def __init__(self, base_url: str, chat_id: str, **kwargs):
+        """
+        Args:
+            base_url (str): Bot URL including the token, e.g. https://api.telegram.org/bot<token>
+            chat_id (str): Telegram chat to send to
+        """
+        super().__init__(**kwargs)
+        self.base_url = base_url
+        self.chat_id = chat_id
+
+    def default_formatter(self, reminder: Dict[str, Any]) -> Any:
+        """Telegram gets the Markdown message as is."""
+        return reminder["message"]
+
+    def send(self, payload: Any, timeout: float) -> Dict[str, Any]:
+        """Post the message with sendMessage and return its message_id and date."""
+        response = requests.post(f"{self.base_url}/sendMessage", json={
+            "chat_id": self.chat_id,
+            "text": payload,
+            "parse_mode": "Markdown"
+        }, timeout=timeout)
+        if response.status_code != 200:
+            raise DeliveryError(f"Status code: {response.status_code}, Response: {response.text}")
+        result = response.json().get("result", {})
+        return {"message_id": result.get("message_id"), "date": result.get("date")}
+
+
+class WebhookChannel(DeliveryChannel):
+    """POSTs reminders as JSON to a generic HTTP endpoint."""
+
+    name = "webhook"
+
+    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs):
+        """
+        Args:
+            url (str): Endpoint receiving the POST
+            headers (dict): Extra HTTP headers, e.g. an Authorization header
+        """
+        super().__init__(**kwargs)
+        self.url = url
+        self.headers = headers or {}
+
+    def default_formatter(self, reminder: Dict[str, Any]) -> Any:
+        """Webhooks get the structured JSON document."""
+        return json_payload(reminder)
+
+    def send(self, payload: Any, timeout: float) -> Dict[str, Any]:
+        """POST the payload as JSON, any 2xx status counts as delivered."""
+        response = requests.post(self.url, json=payload, headers=self.headers, timeout=timeout)
+        if not 200 <= response.status_code < 300:
+            raise DeliveryError(f"Status code: {response.status_code}, Response: {response.text}")
+        return {"status_code": response.status_code}
+
+
+class EmailChannel(DeliveryChannel):
+    """Sends reminders as plain-text email over SMTP."""
+
+    name = "email"
+
+    def __init__(self, host: str, sender: str, recipients: List[str], port: int = 25,
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 use_tls: bool = False, subject: str = EMAIL_SUBJECT, **kwargs):
+        """
+        Args:
+            host (str): SMTP server host
+            sender (str): From address
+            recipients (list): To addresses
+            port (int): SMTP server port
+            username (str): Optional SMTP login
+            password (str): Optional SMTP password
+            use_tls (bool): Upgrade the connection with STARTTLS
+            subject (str): Email subject line
+        """
+        super().__init__(**kwargs)
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = recipients
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.subject = subject
+
+    def send(self, payload: Any, timeout: float) -> Dict[str, Any]:
+        """Send the payload as the body of a plain-text email."""
+        email = EmailMessage()
+        email["Subject"] = self.subject
+        email["From"] = self.sender
+        email["To"] = ", ".join(self.recipients)
+        email.set_content(payload)
+        try:
+            with smtplib.SMTP(self.host, self.port, timeout=timeout) as smtp:
+                if self.use_tls:
+                    smtp.starttls()
+                if self.username:
+                    smtp.login(self.username, self.password or "")
+                refused = smtp.send_message(email)
+        except (smtplib.SMTPException, OSError) as e:
+            raise DeliveryError(f"SMTP error: {e}")
+        return {"recipients": len(self.recipients) - len(refused)}
+
+
+class FileChannel(DeliveryChannel):
+    """Appends reminders to a local file, or prints them to stdout for cron mail."""
+
+    name = "file"
+
+    def __init__(self, path: str = "-", **kwargs):
+        """
+        Args:
+            path (str): File to append to, "-" writes to stdout
+        """
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send(self, payload: Any, timeout: float) -> Dict[str, Any]:
+        """Append the payload to the file, or write it to stdout for "-"."""
+        text = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+        with self._lock:
+            if self.path == "-":
+                sys.stdout.write(text + "\n")
+                sys.stdout.flush()
+            else:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(text + "\n\n")
+        return {"path": self.path, "characters": len(text)}
+
+
+def build_channels(channel_settings: List[Dict[str, Any]]) -> List[DeliveryChannel]:
+    """
+    Build channels from the `delivery_channels` list of `notification_settings`.
+
+    Each entry has a `type` (webhook, email or file) plus that channel's
+    options. Secrets can be left out of the config file: the SMTP password
+    falls back to the SMTP_PASSWORD environment variable.
+
+    Returns:
+        List of configured channels (unknown types are reported and skipped)
+    """
+    channels: List[DeliveryChannel] = []
+    for settings in channel_settings:
+        options = {key: value for key, value in settings.items() if key not in ("type", "enabled")}
+        channel_type = settings.get("type")
+        if not settings.get("enabled", True):
+            continue
+        try:
+            if channel_type == "webhook":
+                channels.append(WebhookChannel(**options))
+            elif channel_type == "email":
+                options.setdefault("password", os.getenv("SMTP_PASSWORD"))
+                channels.append(EmailChannel(**options))
+            elif channel_type == "file":
+                channels.append(FileChannel(**options))
+            else:
+                print(f"⚠️ Unknown delivery channel type: {channel_type}")
+        except TypeError as e:
+            print(f"⚠️ Invalid settings for {channel_type} channel: {e}")
+    return channels
+
+
+def _timed_delivery(channel: DeliveryChannel, reminder: Dict[str, Any], timeout: float,
+                    deadline_at: float) -> Dict[str, Any]:
+    """
+    Deliver on one channel and record its outcome and latency.
+
+    A failure that ends at or after `deadline_at` (a time.perf_counter value)
+    is reported as "timeout", the same as a channel still running at the
+    deadline, so the status doesn't depend on which timer fires first.
+    """
+    started = time.perf_counter()
+    outcome: Dict[str, Any] = {"channel": channel.name}
+    try:
+        outcome["response"] = channel.deliver(reminder, timeout)
+        outcome["status"] = "success"
+    except DeliveryError as e:
+        outcome["status"] = "error"
+        outcome["error"] = str(e)
+    except requests.exceptions.RequestException as e:
+        outcome["status"] = "error"
+        outcome["error"] = f"Network error: {e}"
+    except Exception as e:
+        outcome["status"] = "error"
+        outcome["error"] = f"Unexpected error: {e}"
+    finished = time.perf_counter()
+    if outcome["status"] == "error" and finished >= deadline_at:
+        outcome["status"] = "timeout"
+    outcome["latency_ms"] = round((finished - started) * 1000, 1)
+    return outcome
+
+
+def dispatch(channels: List[DeliveryChannel], reminder: Dict[str, Any],
+             deadline: float = DEFAULT_DEADLINE_SECONDS) -> List[Dict[str, Any]]:
+    """
+    Deliver a reminder on all channels concurrently under one overall deadline.
+
+    The total time is that of the slowest channel, not the sum. Channels still
+    running when the deadline passes, or failing only once it has passed
+    (e.g. on their own I/O timeout), are reported with status "timeout".
+
+    Args:
+        channels: Channels to deliver on
+        reminder (dict): Reminder with message, due_today, overdue, upcoming and season
+        deadline (float): Seconds allowed for the whole dispatch
+
+    Returns:
+        One outcome dict per channel, in channel order, with status and latency_ms
+    """
+    if not channels:
+        return []
+    started = time.perf_counter()
+    deadline_at = started + deadline
+    executor = ThreadPoolExecutor(max_workers=len(channels), thread_name_prefix="delivery")
+    futures = [executor.submit(_timed_delivery, channel, reminder, deadline, deadline_at)
+               for channel in channels]
+    wait(futures, timeout=deadline)
+    # Don't block on channels that overran; their own I/O timeout ends them later
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    outcomes = []
+    for channel, future in zip(channels, futures):
+        if future.done() and not future.cancelled():
+            outcomes.append(future.result())
+        else:
+            outcomes.append({
+                "channel": channel.name,
+                "status": "timeout",
+                "error": f"Deadline of {deadline}s exceeded",
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1)
+            })
+    return outcomes
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Fake Telegram Bot API Server
+A local stand-in for api.telegram.org so the notifier can be exercised offline.
+Implements getMe, sendMessage and getUpdates with configurable latency,
+error injection and 429 rate-limit responses.
+"""
+
+import json
+import random
+import re
+import socketserver
+import threading
+import time
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlparse, parse_qs
+
+_PATH_PATTERN = re.compile(r"^/bot(?P<token>[^/]+)/(?P<method>[A-Za-z]+)$")
+
+
+class BackgroundServer:
+    """
+    Start/stop and context-manager helpers for the local stand-in servers.
+    Wraps a socketserver server and serves it from a background thread.
+    """
+
+    def __init__(self, server: socketserver.BaseServer):
+        self._server = server
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Host and port the server is bound to."""
+        return self._server.server_address[:2]
+
+    def start(self):
+        """Start serving requests in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests in the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        """Stop the server and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class FakeTelegramServer(BackgroundServer):
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0,
+                 retry_after: int = 1, seed: Optional[int] = None,
+                 bot_name: str = "Fake Plant Bot"):
+        """
+        Initialize the fake Bot API server.
+
+        Args:
+            host (str): Interface to bind to
+            port (int): Port to bind to, 0 picks a free port
+            latency (float): Seconds to wait before answering each request
+            latency_jitter (float): Extra random delay of up to this many seconds
+            error_rate (float): Probability (0-1) of answering with a 500 error
+            rate_limit_rate (float): Probability (0-1) of answering with a 429 error
+            retry_after (int): Seconds reported in the 429 `retry_after` parameter
+            seed (int): Optional seed for reproducible error injection
+            bot_name (str): first_name returned by getMe
+        """
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.bot_name = bot_name
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_message_id = 1
+        self._next_update_id = 1
+        self.sent_messages: List[Dict[str, Any]] = []
+        self.pending_updates: List[Dict[str, Any]] = []
+        self.request_counts: Dict[str, int] = {}
+        httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        httpd.daemon_threads = True
+        super().__init__(httpd)
+
+    @property
+    def base_url(self) -> str:
+        """Root URL to pass as `api_base_url` to PlantWateringNotifier."""
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    def push_update(self, text: str, chat_id: str = "0") -> Dict[str, Any]:
+        """Queue an incoming user message to be returned by getUpdates."""
+        with self._lock:
+            update = {
+                "update_id": self._next_update_id,
+                "message": {
+                    "message_id": self._next_message_id,
+                    "date": int(time.time()),
+                    "chat": {"id": chat_id, "type": "private"},
+                    "text": text
+                }
+            }
+            self._next_update_id += 1
+            self._next_message_id += 1
+            self.pending_updates.append(update)
+        return update
+
+    def messages_for_chat(self, chat_id: str) -> List[Dict[str, Any]]:
+        """Return the messages accepted by sendMessage for one chat."""
+        with self._lock:
+            return [m for m in self.sent_messages if str(m["chat"]["id"]) == str(chat_id)]
+
+    def reset(self) -> None:
+        """Forget all recorded messages, updates and request counts."""
+        with self._lock:
+            self.sent_messages.clear()
+            self.pending_updates.clear()
+            self.request_counts.clear()
+
+    def _inject_failure(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Decide whether this request should fail with a 429 or a 500."""
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            return 429, {
+                "ok": False,
+                "error_code": 429,
+                "description": f"Too Many Requests: retry after {self.retry_after}",
+                "parameters": {"retry_after": self.retry_after}
+            }
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500, {"ok": False, "error_code": 500, "description": "Internal Server Error"}
+        return None
+
+    def _simulate_latency(self) -> None:
+        """Sleep for the configured latency plus jitter."""
+        delay = self.latency
+        if self.latency_jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _handle(self, method: str, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """Dispatch one Bot API method call and return (status, body)."""
+        with self._lock:
+            self.request_counts[method] = self.request_counts.get(method, 0) + 1
+
+        self._simulate_latency()
+        failure = self._inject_failure()
+        if failure:
+            return failure
+
+        if method == "getMe":
+            return 200, {"ok": True, "result": {
+                "id": 1, "is_bot": True, "first_name": self.bot_name, "username": "fake_plant_bot"
+            }}
+
+        if method == "sendMessage":
+            if "chat_id" not in params or not params.get("text"):
+                return 400, {"ok": False, "error_code": 400,
+                             "description": "Bad Request: chat_id and text are required"}
+            with self._lock:
+                message = {
+                    "message_id": self._next_message_id,
+                    "date": int(time.time()),
+                    "chat": {"id": params["chat_id"], "type": "private"},
+                    "text": params["text"]
+                }
+                self._next_message_id += 1
+                self.sent_messages.append(message)
+            return 200, {"ok": True, "result": message}
+
+        if method == "getUpdates":
+            offset = int(params.get("offset", 0) or 0)
+            with self._lock:
+                # Like the real API, requesting an offset confirms earlier updates
+                self.pending_updates = [u for u in self.pending_updates if u["update_id"] >= offset]
+                updates = list(self.pending_updates)
+            return 200, {"ok": True, "result": updates}
+
+        return 404, {"ok": False, "error_code": 404, "description": "Not Found"}
+
+    def _make_handler(self):
+        """Build the request handler class bound to this server instance."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self, params: Dict[str, Any]) -> None:
+                match = _PATH_PATTERN.match(urlparse(self.path).path)
+                if not match:
+                    status, body = 404, {"ok": False, "error_code": 404, "description": "Not Found"}
+                else:
+                    status, body = server._handle(match.group("method"), params)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self) -> None:
+                query = parse_qs(urlparse(self.path).query)
+                self._respond({key: values[-1] for key, values in query.items()})
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0) or 0)
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    params = json.loads(raw) if raw else {}
+                except json.JSONDecodeError:
+                    params = {key: values[-1] for key, values in parse_qs(raw.decode("utf-8")).items()}
+                self._respond(params)
+
+            def log_message(self, format: str, *args) -> None:
+                # Keep load tests quiet
+                pass
+
+        return Handler
+
+
+def main():
+    """Run the fake Bot API server in the foreground."""
+    parser = argparse.ArgumentParser(description="Local stand-in for the Telegram Bot API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per request")
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of a 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="probability of a 429")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeTelegramServer(
+        host=args.host, port=args.port, latency=args.latency,
+        latency_jitter=args.latency_jitter, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, retry_after=args.retry_after, seed=args.seed
+    )
+    print(f"🤖 Fake Telegram Bot API listening on {server.base_url}")
+    print(f"💡 Point the notifier at it with TELEGRAM_API_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+End-to-End Load Test
+Drives the full send-and-log pipeline of PlantWateringNotifier against the
+local fake Bot API server at increasing tenant counts, and reports
+messages/second, p50/p99 latency and delivery/log correctness.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List
+
+from fake_telegram_server import FakeTelegramServer
+from plant_watering_notifier import PlantWateringNotifier
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of a list of values (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _run_tenant(notifier: PlantWateringNotifier, rounds: int) -> Dict[str, Any]:
+    """Send `rounds` reminders for one tenant and time each send."""
+    latencies = []
+    successes = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        if notifier.send_watering_reminder():
+            successes += 1
+        latencies.append(time.perf_counter() - started)
+    return {"latencies": latencies, "successes": successes, "failures": rounds - successes}
+
+
+def _check_tenant(server: FakeTelegramServer, notifier: PlantWateringNotifier,
+                  outcome: Dict[str, Any]) -> List[str]:
+    """
+    Cross-check what the tenant reported, what the server received and what was logged.
+
+    Returns:
+        List of human-readable mismatches (empty when the tenant is consistent)
+    """
+    problems = []
+    delivered_ids = {m["message_id"] for m in server.messages_for_chat(notifier.chat_id)}
+
+    with open(notifier.log_file, 'r', encoding='utf-8') as f:
+        events = json.load(f)["watering_events"]
+    logged_success = [e for e in events if e["status"] == "success"]
+    logged_error = [e for e in events if e["status"] == "error"]
+    logged_ids = {e.get("telegram_response", {}).get("message_id") for e in logged_success}
+
+    if outcome["successes"] != len(delivered_ids):
+        problems.append(f"{notifier.chat_id}: {outcome['successes']} reported sent, "
+                        f"{len(delivered_ids)} received by server")
+    if outcome["successes"] != len(logged_success) or outcome["failures"] != len(logged_error):
+        problems.append(f"{notifier.chat_id}: log has {len(logged_success)} success / "
+                        f"{len(logged_error)} error events, expected "
+                        f"{outcome['successes']} / {outcome['failures']}")
+    if logged_ids != delivered_ids:
+        problems.append(f"{notifier.chat_id}: logged message ids do not match delivered ids")
+    return problems
+
+
+def run_load_test(server: FakeTelegramServer, tenants: int, rounds: int = 1,
+                  config_file: str = "plant_config.json") -> Dict[str, Any]:
+    """
+    Run one load level: `tenants` notifiers sending concurrently, `rounds` reminders each.
+
+    Each tenant gets its own chat ID and notification log, mirroring separate
+    deployments that share one bot.
+
+    Args:
+        server (FakeTelegramServer): Running fake Bot API server
+        tenants (int): Number of concurrent tenants
+        rounds (int): Reminders sent sequentially by each tenant
+        config_file (str): Plant configuration shared by all tenants
+
+    Returns:
+        Dict with throughput, latency percentiles and correctness results
+    """
+    server.reset()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        notifiers = [
+            PlantWateringNotifier(
+                f"load_token_{i}", f"tenant-{i}",
+                config_file=config_file,
+                log_file=str(Path(tmp_dir) / f"tenant_{i}_log.json"),
+                api_base_url=server.base_url
+            )
+            for i in range(tenants)
+        ]
+
+        # The notifier reports progress with print(); keep the load report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=tenants) as pool:
+                outcomes = list(pool.map(lambda n: _run_tenant(n, rounds), notifiers))
+            elapsed = time.perf_counter() - started
+
+        problems = []
+        for notifier, outcome in zip(notifiers, outcomes):
+            problems.extend(_check_tenant(server, notifier, outcome))
+
+    latencies = [latency for outcome in outcomes for latency in outcome["latencies"]]
+    successes = sum(outcome["successes"] for outcome in outcomes)
+    return {
+        "tenants": tenants,
+        "attempted": tenants * rounds,
+        "delivered": successes,
+        "failed": tenants * rounds - successes,
+        "elapsed_seconds": elapsed,
+        "messages_per_second": successes / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "correct": not problems,
+        "problems": problems
+    }
+
+
+def print_report(results: List[Dict[str, Any]]) -> None:
+    """Print a table of load test results."""
+    print(f"{'tenants':>8} {'sent':>6} {'failed':>6} {'msg/s':>9} {'p50 ms':>8} {'p99 ms':>8}  correct")
+    for r in results:
+        print(f"{r['tenants']:>8} {r['delivered']:>6} {r['failed']:>6} "
+              f"{r['messages_per_second']:>9.1f} {r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f}  "
+              f"{'✅' if r['correct'] else '❌'}")
+        for problem in r["problems"][:5]:
+            print(f"         ⚠️ {problem}")
+
+
+def main():
+    """Run the load test at increasing tenant counts."""
+    parser = argparse.ArgumentParser(description="Load test the notifier against a fake Bot API")
+    parser.add_argument("--tenants", default="1,5,10,25,50",
+                        help="comma-separated tenant counts to test")
+    parser.add_argument("--rounds", type=int, default=3, help="reminders per tenant")
+    parser.add_argument("--config", default="plant_config.json")
+    parser.add_argument("--latency", type=float, default=0.02, help="fake server latency (s)")
+    parser.add_argument("--latency-jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("🌱 Plant Watering Reminder - Load Test")
+    print("=" * 40)
+
+    tenant_counts = [int(count) for count in args.tenants.split(",") if count.strip()]
+    with FakeTelegramServer(latency=args.latency, latency_jitter=args.latency_jitter,
+                            error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+                            seed=args.seed) as server:
+        print(f"🤖 Fake Bot API at {server.base_url}\n")
+        results = [run_load_test(server, tenants, args.rounds, args.config)
+                   for tenants in tenant_counts]
+
+    print_report(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Local Delivery Sinks
+Stand-ins for the webhook and email delivery channels: an HTTP sink that
+records POSTed reminders and a debugging SMTP server that records emails.
+"""
+
+import argparse
+import email
+import json
+import socketserver
+import threading
+import time
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List
+
+from fake_telegram_server import BackgroundServer
+
+
+class HTTPSink(BackgroundServer):
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, status_code: int = 200):
+        """
+        Initialize an HTTP sink that records every POST it receives.
+
+        Args:
+            host (str): Interface to bind to
+            port (int): Port to bind to, 0 picks a free port
+            latency (float): Seconds to wait before answering
+            status_code (int): Status returned to every request
+        """
+        self.latency = latency
+        self.status_code = status_code
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        httpd.daemon_threads = True
+        super().__init__(httpd)
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}/"
+
+    def _make_handler(self):
+        """Build the request handler class bound to this sink."""
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0) or 0)
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    body = json.loads(raw) if raw else None
+                except json.JSONDecodeError:
+                    body = raw.decode("utf-8", errors="replace")
+                with sink._lock:
+                    sink.requests.append({"path": self.path, "headers": dict(self.headers), "body": body})
+                if sink.latency > 0:
+                    time.sleep(sink.latency)
+                self.send_response(sink.status_code)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class DebugSMTPServer(BackgroundServer):
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        """
+        Initialize a minimal SMTP server that accepts and records every message.
+
+        Supports the commands smtplib needs for plain delivery (EHLO/HELO, MAIL,
+        RCPT, DATA, RSET, NOOP, QUIT); no authentication or TLS.
+
+        Args:
+            host (str): Interface to bind to
+            port (int): Port to bind to, 0 picks a free port
+            latency (float): Seconds to wait before accepting each message
+        """
+        self.latency = latency
+        self.messages: List[Message] = []
+        self._lock = threading.Lock()
+        super().__init__(_ThreadingTCPServer((host, port), self._make_handler()))
+
+    @property
+    def host(self) -> str:
+        return self.address[0]
+
+    @property
+    def port(self) -> int:
+        return self.address[1]
+
+    def _make_handler(self):
+        """Build the SMTP session handler bound to this server."""
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def _reply(self, line: str) -> None:
+                self.wfile.write((line + "\r\n").encode("ascii"))
+                self.wfile.flush()
+
+            def _read_data(self) -> bytes:
+                lines = []
+                for raw in self.rfile:
+                    if raw.rstrip(b"\r\n") == b".":
+                        break
+                    # Undo SMTP dot-stuffing
+                    lines.append(raw[1:] if raw.startswith(b"..") else raw)
+                return b"".join(lines)
+
+            def handle(self) -> None:
+                self._reply("220 localhost debugging SMTP server")
+                for raw in self.rfile:
+                    command = raw.decode("utf-8", errors="replace").strip().split(" ", 1)[0].upper()
+                    if command in ("EHLO", "HELO"):
+                        self._reply("250 localhost")
+                    elif command in ("MAIL", "RCPT", "RSET", "NOOP"):
+                        self._reply("250 OK")
+                    elif command == "DATA":
+                        self._reply("354 End data with <CR><LF>.<CR><LF>")
+                        message = email.message_from_bytes(self._read_data())
+                        if server.latency > 0:
+                            time.sleep(server.latency)
+                        with server._lock:
+                            server.messages.append(message)
+                        self._reply("250 OK: queued")
+                    elif command == "QUIT":
+                        self._reply("221 Bye")
+                        return
+                    else:
+                        self._reply("502 Command not implemented")
+
+        return Handler
+
+
+def main():
+    """Run both sinks in the foreground, printing what they receive."""
+    parser = argparse.ArgumentParser(description="Local webhook and SMTP sinks for delivery testing")
+    parser.add_argument("--http-port", type=int, default=8082)
+    parser.add_argument("--smtp-port", type=int, default=8025)
+    args = parser.parse_args()
+
+    with HTTPSink(port=args.http_port) as http_sink, DebugSMTPServer(port=args.smtp_port) as smtp:
+        print(f"🌐 Webhook sink listening on {http_sink.url}")
+        print(f"📧 Debugging SMTP server listening on {smtp.host}:{smtp.port}")
+        seen_requests, seen_messages = 0, 0
+        try:
+            while True:
+                time.sleep(0.5)
+                for request in http_sink.requests[seen_requests:]:
+                    print(f"🌐 POST {request['path']}: {json.dumps(request['body'], ensure_ascii=False)}")
+                for message in smtp.messages[seen_messages:]:
+                    print(f"📧 {message['Subject']} → {message['To']}\n{message.get_payload(decode=True).decode()}")
+                seen_requests, seen_messages = len(http_sink.requests), len(smtp.messages)
+        except KeyboardInterrupt:
+            print("\n👋 Shutting down")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Plant Catalog Tools
+Species templates that plants inherit from, and a streaming CSV importer
+for building large plant configurations.
+"""
+
+import argparse
+import copy
+import csv
+import datetime
+import json
+import os
+import tempfile
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, Mapping, TextIO
+
+SEASONS = ("spring", "summer", "autumn", "winter")
+MAX_REPORTED_ERRORS = 100
+
+
+class FrozenSchedule(dict):
+    """
+    A watering schedule that can't be modified after it is built.
+
+    Being a real dict, it still serializes with json.dumps like any other
+    part of the config, unlike a mappingproxy.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("watering schedules are shared between plants and read-only")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __ior__(self, other):
+        self._read_only()
+
+    def __reduce__(self):
+        # copy, deepcopy and pickle would otherwise refill the new object
+        # through __setitem__; build it from its items in one go instead
+        return (FrozenSchedule, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return FrozenSchedule(copy.deepcopy(dict(self), memo))
+
+
+class ScheduleCache:
+    """
+    Interns watering schedules so identical schedules share one read-only object.
+    Plants of the same species therefore point at the same schedule mapping.
+    """
+
+    def __init__(self):
+        self._schedules: Dict[str, Mapping[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._schedules)
+
+    def freeze(self, schedule: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Return the shared, immutable copy of `schedule`."""
+        key = json.dumps(schedule, sort_keys=True)
+        frozen = self._schedules.get(key)
+        if frozen is None:
+            adjustments = schedule.get("season_adjustments")
+            values = dict(schedule)
+            if adjustments is not None:
+                values["season_adjustments"] = FrozenSchedule(adjustments)
+            frozen = FrozenSchedule(values)
+            self._schedules[key] = frozen
+        return frozen
+
+
+def _merge_schedule(base: Mapping[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
+    """Overlay a per-plant schedule on a species schedule, merging season adjustments."""
+    merged = {**base, **override}
+    if "season_adjustments" in base and "season_adjustments" in override:
+        merged["season_adjustments"] = {**base["season_adjustments"], **override["season_adjustments"]}
+    return merged
+
+
+def resolve_species_templates(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Expand species templates into each plant entry.
+
+    A plant with a `species` key inherits every field of that entry in the
+    config's `species` section; fields set on the plant win, and a plant's
+    `watering_schedule` is merged over the species schedule. All resulting
+    schedules are interned, so plants sharing a schedule share one
+    read-only mapping.
+
+    Args:
+        config (dict): Parsed plant configuration
+
+    Returns:
+        dict: The same configuration with `plants` replaced by resolved entries
+    """
+    species_templates = config.get("species", {})
+    cache = ScheduleCache()
+    species_schedules: Dict[Optional[str], Optional[Mapping[str, Any]]] = {}
+    resolved_plants = []
+
+    for plant in config.get("plants", []):
+        species_key = plant.get("species")
+        template = {}
+        if species_key is not None:
+            template = species_templates.get(species_key)
+            if template is None:
+                print(f"⚠️ Unknown species '{species_key}' for plant {plant.get('id')}")
+                template = {}
+
+        resolved = {**template, **plant}
+        override = plant.get("watering_schedule")
+        if override is None and species_key in species_schedules:
+            # Common case at scale: no override, reuse the species schedule directly
+            schedule = species_schedules[species_key]
+        else:
+            merged = _merge_schedule(template.get("watering_schedule", {}), override or {})
+            schedule = cache.freeze(merged) if merged else None
+            if override is None:
+                species_schedules[species_key] = schedule
+        if schedule is not None:
+            resolved["watering_schedule"] = schedule
+        resolved_plants.append(resolved)
+
+    return {**config, "plants": resolved_plants}
+
+
+def _parse_days(value: str, field: str) -> Optional[int]:
+    """Parse a positive day count from a CSV cell, empty cells mean 'not set'."""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        days = int(value)
+    except ValueError:
+        raise ValueError(f"{field} must be a whole number of days, got '{value}'")
+    if days <= 0:
+        raise ValueError(f"{field} must be positive, got {days}")
+    return days
+
+
+def _row_to_plant(row: Dict[str, str], species: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Convert one CSV row into a plant entry, raising ValueError if it is invalid.
+
+    Only fields present in the row are written, so plants referencing a
+    species stay compact and inherit the rest at load time.
+    """
+    cells = {key.strip(): (value or "").strip() for key, value in row.items() if key}
+
+    for field in ("id", "name", "location"):
+        if not cells.get(field):
+            raise ValueError(f"missing required field '{field}'")
+
+    plant: Dict[str, Any] = {"id": cells["id"], "name": cells["name"], "location": cells["location"]}
+
+    species_key = cells.get("species")
+    if species_key:
+        if species_key not in species:
+            raise ValueError(f"unknown species '{species_key}'")
+        plant["species"] = species_key
+
+    for field in ("type", "scientific_name", "care_notes", "emoji"):
+        if cells.get(field):
+            plant[field] = cells[field]
+
+    schedule: Dict[str, Any] = {}
+    frequency = _parse_days(cells.get("frequency_days", ""), "frequency_days")
+    if frequency is not None:
+        schedule["frequency_days"] = frequency
+    adjustments = {}
+    for season in SEASONS:
+        days = _parse_days(cells.get(season, ""), season)
+        if days is not None:
+            adjustments[season] = days
+    if adjustments:
+        schedule["season_adjustments"] = adjustments
+    if schedule:
+        plant["watering_schedule"] = schedule
+    elif not species_key:
+        raise ValueError("needs either a species or a frequency_days value")
+
+    active = cells.get("active", "").lower()
+    if active:
+        if active not in ("true", "false", "1", "0", "yes", "no"):
+            raise ValueError(f"active must be true/false, got '{cells['active']}'")
+        plant["active"] = active in ("true", "1", "yes")
+    else:
+        plant["active"] = True
+
+    return plant
+
+
+def iter_catalog_rows(csv_file: TextIO, species: Mapping[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream plants out of a CSV catalog one row at a time.
+
+    Yields:
+        dict: {"row": line number, "plant": entry} or {"row": line number, "error": message}
+    """
+    reader = csv.DictReader(csv_file)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            # The reader skips the rest of the broken line, so the import can go on;
+            # line_num isn't advanced for the line that failed
+            yield {"row": reader.line_num + 1, "error": f"unreadable row: {e}"}
+            continue
+        try:
+            yield {"row": reader.line_num, "plant": _row_to_plant(row, species)}
+        except ValueError as e:
+            yield {"row": reader.line_num, "error": str(e)}
+
+
+def import_catalog_csv(csv_path: str, output_path: str,
+                       template_config: Optional[str] = None,
+                       errors_path: Optional[str] = None,
+                       check_duplicate_ids: bool = False) -> Dict[str, Any]:
+    """
+    Import a CSV plant catalog into a plant configuration JSON file.
+
+    Rows are read and written one at a time, so memory use does not grow with
+    the number of rows. Invalid rows are skipped and reported with their line
+    number; every error goes to `errors_path` when given, and the first
+    MAX_REPORTED_ERRORS are returned in the summary. The output is written to
+    a temporary file next to `output_path` and only replaces it once the
+    import has finished, so a failed import never leaves a broken config.
+    The CSV may start with a UTF-8 byte order mark, as Excel and Sheets write.
+
+    Args:
+        csv_path (str): CSV catalog with columns id, name, location and optionally
+            species, type, scientific_name, frequency_days, spring, summer,
+            autumn, winter, care_notes, emoji, active
+        output_path (str): Plant configuration JSON file to write
+        template_config (str): Existing config whose `species` and
+            `notification_settings` sections are copied into the output
+        errors_path (str): Optional CSV file receiving one line per rejected row
+        check_duplicate_ids (bool): Reject repeated plant IDs (keeps every ID in memory)
+
+    Returns:
+        dict: Summary with imported/rejected counts and reported errors
+    """
+    species: Dict[str, Any] = {}
+    notification_settings: Dict[str, Any] = {}
+    if template_config:
+        with open(template_config, 'r', encoding='utf-8') as f:
+            template = json.load(f)
+        species = template.get("species", {})
+        notification_settings = template.get("notification_settings", {})
+
+    summary: Dict[str, Any] = {"imported": 0, "rejected": 0, "errors": []}
+    seen_ids = set()
+    output_dir = Path(output_path).resolve().parent
+    out_fd, temp_path = tempfile.mkstemp(prefix=f".{Path(output_path).name}.", suffix=".tmp",
+                                         dir=output_dir)
+    try:
+        # The temp file is opened first so its descriptor is closed even if the others fail
+        with open(out_fd, 'w', encoding='utf-8') as out, \
+                open(csv_path, 'r', encoding='utf-8-sig', newline='') as source, \
+                (open(errors_path, 'w', encoding='utf-8', newline='') if errors_path
+                 else nullcontext()) as errors_file:
+            errors_writer = csv.writer(errors_file) if errors_file else None
+            if errors_writer:
+                errors_writer.writerow(["row", "error"])
+
+            metadata = {
+                "version": "1.0",
+                "created_at": datetime.date.today().isoformat(),
+                "description": f"Plant watering configuration imported from {Path(csv_path).name}"
+            }
+            out.write('{\n  "metadata": ' + json.dumps(metadata, ensure_ascii=False))
+            out.write(',\n  "species": ' + json.dumps(species, ensure_ascii=False))
+            out.write(',\n  "plants": [')
+
+            for result in iter_catalog_rows(source, species):
+                error = result.get("error")
+                plant = result.get("plant")
+                if plant and check_duplicate_ids:
+                    if plant["id"] in seen_ids:
+                        error = f"duplicate plant id '{plant['id']}'"
+                    seen_ids.add(plant["id"])
+
+                if error:
+                    summary["rejected"] += 1
+                    if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+                        summary["errors"].append({"row": result["row"], "error": error})
+                    if errors_writer:
+                        errors_writer.writerow([result["row"], error])
+                    continue
+
+                out.write("\n    " if summary["imported"] == 0 else ",\n    ")
+                out.write(json.dumps(plant, ensure_ascii=False))
+                summary["imported"] += 1
+
+            out.write("\n  ],\n  \"notification_settings\": "
+                      + json.dumps(notification_settings, ensure_ascii=False) + "\n}\n")
+        os.replace(temp_path, output_path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+    return summary
+
+
+def main():
+    """Import a CSV plant catalog from the command line."""
+    parser = argparse.ArgumentParser(description="Import a CSV plant catalog into a plant config")
+    parser.add_argument("csv_path")
+    parser.add_argument("output_path")
+    parser.add_argument("--templates", help="config file providing species templates")
+    parser.add_argument("--errors", help="write rejected rows to this CSV file")
+    parser.add_argument("--check-duplicates", action="store_true",
+                        help="reject repeated plant IDs")
+    args = parser.parse_args()
+
+    summary = import_catalog_csv(args.csv_path, args.output_path, args.templates,
+                                 args.errors, args.check_duplicates)
+    print(f"✅ Imported {summary['imported']} plants into {args.output_path}")
+    if summary["rejected"]:
+        print(f"⚠️ Rejected {summary['rejected']} rows")
+        for error in summary["errors"][:10]:
+            print(f"   row {error['row']}: {error['error']}")
+
+if __name__ == "__main__":
+    main()
@@ -14,10 +14,21 @@ import random
 from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
+from delivery_channels import (DEFAULT_DEADLINE_SECONDS, DeliveryChannel, TelegramChannel,
+                               build_channels, dispatch)
+from plant_catalog import resolve_species_templates
+from watering_scheduler import (coalescing_settings, frequency_for_season, season_for_date,
+                                select_for_today, skip_runs_without_watering, watering_window)
+
+DEFAULT_API_BASE_URL = "https://api.telegram.org"
+
 class PlantWateringNotifier:
     def __init__(self, bot_token: str, chat_id: str, 
                  config_file: str = "plant_config.json",
-                 log_file: str = "notifications_log.json"):
+                 log_file: str = "notifications_log.json",
+                 api_base_url: str = DEFAULT_API_BASE_URL,
+                 channels: Optional[List[DeliveryChannel]] = None,
+                 delivery_deadline: float = DEFAULT_DEADLINE_SECONDS):
         """
         Initialize the Plant Watering Notifier.
         
@@ -26,10 +37,18 @@ class PlantWateringNotifier:
             chat_id (str): Your Telegram chat ID
             config_file (str): Path to the plant configuration JSON file
             log_file (str): Path to the notifications log JSON file
+            api_base_url (str): Bot API server root, override to target a local stand-in
+            channels (list): Delivery channels to use instead of Telegram plus the
+                `delivery_channels` configured in the plant config
+            delivery_deadline (float): Seconds allowed for delivering on all channels
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.base_url = f"https://api.telegram.org/bot{bot_token}"
+        self.api_base_url = api_base_url.rstrip("/")
+        self.base_url = f"{self.api_base_url}/bot{bot_token}"
+        self.channels = channels
+        self.delivery_deadline = delivery_deadline
+        self.reminder_skipped = False
         self.config_file = Path(config_file)
         self.log_file = Path(log_file)
         self._ensure_files_exist()
@@ -52,21 +71,18 @@ class PlantWateringNotifier:
     
     def _get_current_season(self) -> str:
         """Determine the current season based on the month."""
-        month = datetime.datetime.now().month
-        if month in [3, 4, 5]:
-            return "spring"
-        elif month in [6, 7, 8]:
-            return "summer"
-        elif month in [9, 10, 11]:
-            return "autumn"
-        else:
-            return "winter"
+        return season_for_date(datetime.date.today())
     
     def _load_plant_config(self) -> Dict[str, Any]:
-        """Load plant configuration from JSON file."""
+        """
+        Load plant configuration from JSON file, expanding species templates.
+        
+        Each plant's `watering_schedule` is a read-only dict shared with every
+        plant that has the same schedule; copy it before changing it.
+        """
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                return resolve_species_templates(json.load(f))
         except FileNotFoundError:
             print(f"❌ Plant config file not found: {self.config_file}")
             return {"plants": [], "notification_settings": {}}
@@ -110,29 +126,34 @@ class PlantWateringNotifier:
         current_season = self._get_current_season()
         
         # Get frequency for current season, fallback to default frequency
-        schedule = plant.get("watering_schedule", {})
-        season_adjustments = schedule.get("season_adjustments", {})
-        frequency_days = season_adjustments.get(current_season, schedule.get("frequency_days", 7))
+        frequency_days = frequency_for_season(plant, current_season)
         
         return last_date + datetime.timedelta(days=frequency_days)
     
-    def _get_plants_needing_water(self) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    def _get_plants_needing_water(self, config: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict], List[Dict], List[Dict]]:
         """
         Get plants that need watering today, are overdue, or are due soon.
         Based on notifications log instead of separate watering history.
         
+        Args:
+            config (dict): Already loaded plant configuration, read from disk if omitted
+        
         Returns:
             Tuple of (due_today, overdue, upcoming_in_2_days)
         """
-        config = self._load_plant_config()
+        if config is None:
+            config = self._load_plant_config()
         last_watered_dates = self._load_watering_history_from_logs()
         
         due_today = []
         overdue = []
         upcoming_in_2_days = []
         today = datetime.date.today()
+        coalescing = coalescing_settings(config)
+        # Per location: plant index -> (plant, days until due, watering window)
+        candidates_by_location: Dict[str, Dict[int, Tuple[Dict, Optional[int], Tuple]]] = {}
         
-        for plant in config.get("plants", []):
+        for index, plant in enumerate(config.get("plants", [])):
             if not plant.get("active", True):
                 continue
                 
@@ -141,21 +162,57 @@ class PlantWateringNotifier:
             
             if not last_watered:
                 # If no watering history, assume it needs watering today
-                due_today.append(plant)
+                if coalescing:
+                    candidates_by_location.setdefault(plant.get("location", ""), {})[index] = (
+                        plant, None, (today, today, today))
+                else:
+                    due_today.append(plant)
                 continue
             
             next_due = self._calculate_next_watering_date(plant, last_watered)
             days_until_due = (next_due - today).days
             
-            if days_until_due < 0:
+            if coalescing:
+                last_date = datetime.datetime.strptime(last_watered, "%Y-%m-%d").date()
+                window = watering_window(plant, last_date, next_due, coalescing)
+                candidates_by_location.setdefault(plant.get("location", ""), {})[index] = (
+                    plant, days_until_due, window)
+            elif days_until_due < 0:
                 overdue.append(plant)
             elif days_until_due == 0:
                 due_today.append(plant)
             elif days_until_due <= 2:
                 upcoming_in_2_days.append(plant)
         
+        # Coalescing: visit a location on the planned day (a plant's due date, unless
+        # a later day in its window lets one visit cover more plants), then water
+        # everything whose window is open; the rest is reported as upcoming
+        for candidates in candidates_by_location.values():
+            watered = set(select_for_today({key: c[2] for key, c in candidates.items()}, today))
+            for key, (plant, days_until_due, window) in candidates.items():
+                if key in watered:
+                    # Moved within its tolerance window on purpose, so only overdue once past it
+                    if window[2] < today:
+                        overdue.append(plant)
+                    else:
+                        due_today.append(plant)
+                elif days_until_due is None or days_until_due <= 2:
+                    upcoming_in_2_days.append(plant)
+        
         return due_today, overdue, upcoming_in_2_days
     
+    def _get_delivery_channels(self, config: Dict[str, Any]) -> List[DeliveryChannel]:
+        """
+        Get the channels to deliver reminders on.
+        
+        Uses the channels given to the constructor if any, otherwise Telegram plus
+        the `delivery_channels` listed in the config's notification settings.
+        """
+        if self.channels is not None:
+            return self.channels
+        channel_settings = config.get("notification_settings", {}).get("delivery_channels", [])
+        return [TelegramChannel(self.base_url, self.chat_id)] + build_channels(channel_settings)
+    
     def _format_plant_reminder_message(self, due_today: List[Dict], overdue: List[Dict], upcoming: List[Dict]) -> str:
         """Format the plant watering reminder message."""
         if not due_today and not overdue and not upcoming:
@@ -204,7 +261,8 @@ class PlantWateringNotifier:
         return "\n".join(message_parts)
     
     def _log_watering_notification(self, message: str, status: str, plants_watered: List[Dict], 
-                                  response_data: Optional[Dict] = None, error: Optional[str] = None) -> None:
+                                  response_data: Optional[Dict] = None, error: Optional[str] = None,
+                                  deliveries: Optional[List[Dict]] = None) -> None:
         """Log a watering notification to the JSON file."""
         try:
             # Read existing data
@@ -235,6 +293,10 @@ class PlantWateringNotifier:
                     "success": True
                 }
             
+            # Add per-channel outcome and latency if available
+            if deliveries is not None:
+                notification_entry["deliveries"] = deliveries
+            
             # Add error if any
             if error:
                 notification_entry["error"] = error
@@ -257,14 +319,23 @@ class PlantWateringNotifier:
     
     def send_watering_reminder(self) -> bool:
         """
-        Send plant watering reminders to Telegram and log the notification.
-        Assumes watering is completed when notification is sent.
+        Send plant watering reminders on all delivery channels and log the notification.
+        Assumes watering is completed when notification is sent on at least one channel.
+        With `skip_runs_without_watering` set, nothing is sent on runs where no
+        plant is due or overdue; `reminder_skipped` tells such runs apart.
         
         Returns:
-            bool: True if message was sent successfully, False otherwise
+            bool: True if message was sent successfully (or skipped), False otherwise
         """
+        self.reminder_skipped = False
         try:
-            due_today, overdue, upcoming = self._get_plants_needing_water()
+            config = self._load_plant_config()
+            due_today, overdue, upcoming = self._get_plants_needing_water(config)
+            
+            if skip_runs_without_watering(config) and not due_today and not overdue:
+                print("🌿 No plants need watering today, no reminder sent")
+                self.reminder_skipped = True
+                return True
             
             # Prepare plants that will be "watered" when notification is sent
             plants_to_water = []
@@ -288,30 +359,39 @@ class PlantWateringNotifier:
                 })
             
             message = self._format_plant_reminder_message(due_today, overdue, upcoming)
-            
-            url = f"{self.base_url}/sendMessage"
-            payload = {
-                "chat_id": self.chat_id,
-                "text": message,
-                "parse_mode": "Markdown"
+            reminder = {
+                "message": message,
+                "due_today": due_today,
+                "overdue": overdue,
+                "upcoming": upcoming,
+                "season": self._get_current_season()
             }
             
-            response = requests.post(url, json=payload, timeout=10)
+            # Deliver on every channel at once; the run takes as long as the slowest channel
+            deliveries = dispatch(self._get_delivery_channels(config), reminder, self.delivery_deadline)
+            delivered = [d for d in deliveries if d["status"] == "success"]
+            telegram = next((d for d in delivered if d["channel"] == TelegramChannel.name), None)
             
-            if response.status_code == 200:
+            if delivered:
                 total_plants = len(due_today) + len(overdue)
-                print(f"✅ Plant watering reminder sent successfully! ({total_plants} plants watered)")
+                channel_names = ", ".join(d["channel"] for d in delivered)
+                print(f"✅ Plant watering reminder sent successfully via {channel_names}! ({total_plants} plants watered)")
+                for failed in deliveries:
+                    if failed["status"] != "success":
+                        print(f"⚠️ {failed['channel']} delivery failed: {failed.get('error')}")
                 
                 # Log successful notification with plants watered
                 self._log_watering_notification(
                     message=message,
                     status="success",
                     plants_watered=plants_to_water,
-                    response_data=response.json()
+                    response_data={"result": telegram["response"]} if telegram else None,
+                    deliveries=deliveries
                 )
                 return True
             else:
-                error_msg = f"Status code: {response.status_code}, Response: {response.text}"
+                error_msg = "; ".join(f"{d['channel']}: {d.get('error')}" for d in deliveries) \
+                    or "No delivery channels configured"
                 print(f"❌ Failed to send message. {error_msg}")
                 
                 # Log failed notification
@@ -319,22 +399,11 @@ class PlantWateringNotifier:
                     message=message,
                     status="error",
                     plants_watered=[],
-                    error=error_msg
+                    error=error_msg,
+                    deliveries=deliveries
                 )
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Network error: {e}"
-            print(f"❌ {error_msg}")
-            
-            # Log network error
-            self._log_watering_notification(
-                message="Failed to send plant reminder due to network error",
-                status="error",
-                plants_watered=[],
-                error=error_msg
-            )
-            return False
         except Exception as e:
             error_msg = f"Unexpected error: {e}"
             print(f"❌ {error_msg}")
@@ -384,6 +453,15 @@ def load_config() -> tuple[Optional[str], Optional[str]]:
     
     return bot_token, chat_id
 
+def load_api_base_url() -> str:
+    """
+    Load the Bot API base URL, allowing a local server to replace api.telegram.org.
+    
+    Returns:
+        str: Value of TELEGRAM_API_BASE_URL, or the public Telegram endpoint
+    """
+    return os.getenv('TELEGRAM_API_BASE_URL') or DEFAULT_API_BASE_URL
+
 def main():
     """Send plant watering reminders and exit."""
     print("🌱 Plant Watering Reminder System v2.0")
@@ -396,7 +474,7 @@ def main():
         print("💡 Make sure TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID secrets are set in GitHub.")
         return
     
-    notifier = PlantWateringNotifier(bot_token, chat_id)
+    notifier = PlantWateringNotifier(bot_token, chat_id, api_base_url=load_api_base_url())
     
     # Test connection first
     if not notifier.test_connection():
@@ -405,7 +483,9 @@ def main():
     
     # Send the plant watering reminders
     success = notifier.send_watering_reminder()
-    if success:
+    if success and notifier.reminder_skipped:
+        print("🌿 Nothing to water today, no reminder needed.")
+    elif success:
         print("🎉 Plant watering reminders sent successfully via GitHub Actions! 🌿")
         print("💧 Watering assumed completed for all notified plants.")
     else:
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test script for multi-channel delivery
+Uses the fake Bot API, an HTTP sink and a debugging SMTP server, all local
+"""
+
+import io
+import json
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from delivery_channels import (DeliveryChannel, DeliveryError, EmailChannel, FileChannel,
+                               TelegramChannel, WebhookChannel, _timed_delivery, build_channels,
+                               dispatch)
+from fake_telegram_server import FakeTelegramServer
+from local_delivery_sinks import DebugSMTPServer, HTTPSink
+from plant_watering_notifier import PlantWateringNotifier
+
+REMINDER = {
+    "message": "🌱 **Plant Watering Reminders**\n\n📅 **Due Today:**\n🌿 *Fern* (Office)",
+    "due_today": [{"id": "fern", "name": "Fern", "location": "Office"}],
+    "overdue": [],
+    "upcoming": [],
+    "season": "spring"
+}
+
+def _read_events(log_file: Path) -> list:
+    with open(log_file, 'r', encoding='utf-8') as f:
+        return json.load(f)["watering_events"]
+
+def test_channels_are_dispatched_concurrently():
+    """Three slow channels finish in about the time of one, each with its own format."""
+    print("🧪 Testing concurrent dispatch")
+    latency = 0.3
+    with FakeTelegramServer(latency=latency) as telegram, HTTPSink(latency=latency) as sink, \
+            DebugSMTPServer(latency=latency) as smtp:
+        channels = [
+            TelegramChannel(f"{telegram.base_url}/botfake_token", "chat-1"),
+            WebhookChannel(sink.url),
+            EmailChannel(smtp.host, "bot@example.com", ["me@example.com"], port=smtp.port)
+        ]
+        started = time.perf_counter()
+        outcomes = dispatch(channels, REMINDER, deadline=5)
+        elapsed = time.perf_counter() - started
+
+        assert [o["status"] for o in outcomes] == ["success"] * 3, outcomes
+        assert elapsed < latency * 2.5
+        assert all(o["latency_ms"] >= latency * 1000 for o in outcomes)
+        assert telegram.messages_for_chat("chat-1")[0]["text"] == REMINDER["message"]
+        assert sink.requests[0]["body"]["due_today"] == REMINDER["due_today"]
+        body = smtp.messages[0].get_payload(decode=True).decode("utf-8")
+        assert "Plant Watering Reminders" in body and "*" not in body
+    print(f"✅ 3 channels delivered in {elapsed:.2f}s")
+
+def test_deadline_and_custom_formatter():
+    """Channels that overrun the deadline are reported as timeouts without delaying the rest."""
+    with HTTPSink(latency=2.0) as slow_sink, tempfile.TemporaryDirectory() as tmp_dir:
+        output = Path(tmp_dir) / "reminders.txt"
+        channels = [
+            WebhookChannel(slow_sink.url, name="slow_webhook"),
+            FileChannel(str(output), formatter=lambda reminder: f"{len(reminder['due_today'])} plants due")
+        ]
+        started = time.perf_counter()
+        outcomes = dispatch(channels, REMINDER, deadline=0.3)
+        assert time.perf_counter() - started < 1.5
+        assert outcomes[0]["channel"] == "slow_webhook" and outcomes[0]["status"] == "timeout"
+        assert outcomes[1]["status"] == "success"
+        assert output.read_text(encoding='utf-8').strip() == "1 plants due"
+
+class _SlowFailingChannel(DeliveryChannel):
+    """Channel that fails just after the deadline, like an I/O timeout would."""
+
+    name = "slow_failing"
+
+    def send(self, payload, timeout):
+        """Sleep past the deadline, then fail."""
+        time.sleep(timeout + 0.05)
+        raise DeliveryError("Read timed out")
+
+def test_failure_after_deadline_is_a_timeout():
+    """Whether the deadline or the channel's own timeout fires first, the status is "timeout"."""
+    for deadline in (0.1, 0.2, 0.3):
+        outcome = dispatch([_SlowFailingChannel()], REMINDER, deadline=deadline)[0]
+        assert outcome["status"] == "timeout", outcome
+    # Let the outcome be decided by the channel: it has already finished when checked
+    started = time.perf_counter()
+    outcome = _timed_delivery(_SlowFailingChannel(), REMINDER, 0.1, started + 0.1)
+    assert outcome["status"] == "timeout"
+
+def test_notifier_logs_per_channel_outcomes():
+    """The notifier delivers on Telegram plus configured channels and logs each outcome."""
+    print("🧪 Testing notifier multi-channel logging")
+    with FakeTelegramServer() as telegram, HTTPSink(status_code=500) as broken_sink, \
+            tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        config_file = tmp / "config.json"
+        config_file.write_text(json.dumps({
+            "plants": [{"id": "fern", "name": "Fern", "location": "Office",
+                        "watering_schedule": {"frequency_days": 5}}],
+            "notification_settings": {"delivery_channels": [
+                {"type": "webhook", "url": broken_sink.url},
+                {"type": "file", "path": "-"}
+            ]}
+        }), encoding='utf-8')
+        log_file = tmp / "log.json"
+        notifier = PlantWateringNotifier("fake_token", "chat-1", config_file=str(config_file),
+                                         log_file=str(log_file), api_base_url=telegram.base_url)
+
+        with redirect_stdout(io.StringIO()) as stdout:
+            assert notifier.send_watering_reminder()
+        assert "Fern" in stdout.getvalue()
+
+        event = _read_events(log_file)[-1]
+        assert event["status"] == "success"
+        assert event["plants_watered"][0]["plant_id"] == "fern"
+        assert event["telegram_response"]["message_id"] is not None
+        statuses = {d["channel"]: d["status"] for d in event["deliveries"]}
+        assert statuses == {"telegram": "success", "webhook": "error", "file": "success"}
+        assert all("latency_ms" in d for d in event["deliveries"])
+    print("✅ Per-channel outcomes logged")
+
+def test_all_channels_failing_logs_error():
+    """When no channel delivers, nothing is assumed watered."""
+    with HTTPSink(status_code=503) as sink, tempfile.TemporaryDirectory() as tmp_dir:
+        log_file = Path(tmp_dir) / "log.json"
+        notifier = PlantWateringNotifier("fake_token", "chat-1", log_file=str(log_file),
+                                         channels=[WebhookChannel(sink.url)])
+        assert not notifier.send_watering_reminder()
+        event = _read_events(log_file)[-1]
+        assert event["status"] == "error"
+        assert event["plants_watered"] == []
+        assert "503" in event["error"]
+
+def test_build_channels_skips_unknown_and_disabled():
+    channels = build_channels([
+        {"type": "file", "path": "-"},
+        {"type": "webhook", "url": "http://127.0.0.1:1/", "enabled": False},
+        {"type": "pager"}
+    ])
+    assert [c.name for c in channels] == ["file"]
+
+def test_channel_without_send_fails_on_creation():
+    """A channel class that forgets send() can't be instantiated."""
+    class BrokenChannel(DeliveryChannel):
+        name = "broken"
+
+    try:
+        BrokenChannel()
+        assert False, "channel without send() should not be created"
+    except TypeError:
+        pass
+
+if __name__ == "__main__":
+    test_channels_are_dispatched_concurrently()
+    test_deadline_and_custom_formatter()
+    test_failure_after_deadline_is_a_timeout()
+    test_notifier_logs_per_channel_outcomes()
+    test_all_channels_failing_logs_error()
+    test_build_channels_skips_unknown_and_disabled()
+    test_channel_without_send_fails_on_creation()
+    print("\n🎉 All tests completed successfully!")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the fake Telegram Bot API server and load test harness
+Runs the notifier end-to-end against a local server, no credentials needed
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import requests
+
+from fake_telegram_server import FakeTelegramServer
+from load_test import run_load_test
+from plant_watering_notifier import PlantWateringNotifier
+
+def _read_events(log_file: Path) -> list:
+    with open(log_file, 'r', encoding='utf-8') as f:
+        return json.load(f)["watering_events"]
+
+def test_notifier_against_fake_server():
+    """Send a reminder through the fake server and check it was delivered and logged."""
+    print("🧪 Testing notifier against fake Bot API")
+    with FakeTelegramServer() as server, tempfile.TemporaryDirectory() as tmp_dir:
+        log_file = Path(tmp_dir) / "log.json"
+        notifier = PlantWateringNotifier("fake_token", "chat-1", log_file=str(log_file),
+                                         api_base_url=server.base_url)
+
+        assert notifier.test_connection()
+        assert notifier.send_watering_reminder()
+
+        delivered = server.messages_for_chat("chat-1")
+        events = _read_events(log_file)
+        assert len(delivered) == 1
+        assert events[-1]["status"] == "success"
+        assert events[-1]["telegram_response"]["message_id"] == delivered[0]["message_id"]
+        print(f"✅ Delivered message {delivered[0]['message_id']} and logged it")
+
+def test_error_and_rate_limit_injection():
+    """Injected 500 and 429 responses are logged as errors and 429 carries retry_after."""
+    print("🧪 Testing error injection")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for settings in ({"error_rate": 1.0}, {"rate_limit_rate": 1.0, "retry_after": 7}):
+            with FakeTelegramServer(**settings) as server:
+                log_file = Path(tmp_dir) / "log.json"
+                log_file.unlink(missing_ok=True)
+                notifier = PlantWateringNotifier("fake_token", "chat-1", log_file=str(log_file),
+                                                 api_base_url=server.base_url)
+                assert not notifier.send_watering_reminder()
+                assert server.messages_for_chat("chat-1") == []
+                assert _read_events(log_file)[-1]["status"] == "error"
+
+                if "retry_after" in settings:
+                    response = requests.post(f"{server.base_url}/botfake_token/sendMessage",
+                                             json={"chat_id": "chat-1", "text": "hi"}, timeout=5)
+                    assert response.status_code == 429
+                    assert response.json()["parameters"]["retry_after"] == 7
+    print("✅ Failures logged, 429 reports retry_after")
+
+def test_get_updates():
+    """getUpdates returns queued updates and confirms them once an offset is passed."""
+    with FakeTelegramServer() as server:
+        update = server.push_update("/status", chat_id="chat-1")
+        url = f"{server.base_url}/botfake_token/getUpdates"
+        assert requests.get(url, timeout=5).json()["result"] == [update]
+        next_offset = update["update_id"] + 1
+        assert requests.get(url, params={"offset": next_offset}, timeout=5).json()["result"] == []
+    print("✅ getUpdates honours offsets")
+
+def test_load_harness_correctness():
+    """A small concurrent load run delivers and logs every message consistently."""
+    print("🧪 Testing load harness")
+    with FakeTelegramServer(latency=0.005) as server:
+        result = run_load_test(server, tenants=4, rounds=2)
+    assert result["correct"], result["problems"]
+    assert result["delivered"] == 8
+    assert result["p99_ms"] >= result["p50_ms"] > 0
+    print(f"✅ {result['delivered']} messages, {result['messages_per_second']:.1f} msg/s")
+
+if __name__ == "__main__":
+    test_notifier_against_fake_server()
+    test_error_and_rate_limit_injection()
+    test_get_updates()
+    test_load_harness_correctness()
+    print("\n🎉 All tests completed successfully!")
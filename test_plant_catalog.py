@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test script for species templates and the CSV catalog importer
+"""
+
+import copy
+import csv
+import datetime
+import json
+import pickle
+import tempfile
+from pathlib import Path
+
+from plant_catalog import import_catalog_csv, resolve_species_templates
+from plant_watering_notifier import PlantWateringNotifier
+
+SPECIES = {
+    "spider_plant": {
+        "type": "Spider Plant",
+        "scientific_name": "Chlorophytum comosum",
+        "care_notes": "Water when top inch of soil is dry.",
+        "emoji": "🕷️",
+        "watering_schedule": {
+            "frequency_days": 7,
+            "season_adjustments": {"spring": 6, "summer": 5, "autumn": 8, "winter": 12}
+        }
+    }
+}
+
+def test_species_templates_are_inherited_and_shared():
+    """Plants inherit species fields, overrides win and schedules are shared read-only."""
+    print("🧪 Testing species templates")
+    config = {
+        "species": SPECIES,
+        "plants": [
+            {"id": "a", "name": "Spider A", "location": "Kitchen", "species": "spider_plant"},
+            {"id": "b", "name": "Spider B", "location": "Hall", "species": "spider_plant"},
+            {"id": "c", "name": "Spider C", "location": "Porch", "species": "spider_plant",
+             "care_notes": "Outdoors, check after rain.",
+             "watering_schedule": {"season_adjustments": {"summer": 3}}}
+        ]
+    }
+    a, b, c = resolve_species_templates(config)["plants"]
+
+    assert a["scientific_name"] == "Chlorophytum comosum"
+    assert a["watering_schedule"] is b["watering_schedule"]
+    assert c["care_notes"] == "Outdoors, check after rain."
+    assert c["watering_schedule"]["frequency_days"] == 7
+    assert c["watering_schedule"]["season_adjustments"] == {"spring": 6, "summer": 3, "autumn": 8, "winter": 12}
+    try:
+        a["watering_schedule"]["frequency_days"] = 1
+        assert False, "shared schedule should be read-only"
+    except TypeError:
+        pass
+    assert json.loads(json.dumps(a))["watering_schedule"]["frequency_days"] == 7
+    print("✅ Templates inherited, overrides applied, schedules shared")
+
+def test_resolved_plants_can_be_copied_and_pickled():
+    """deepcopy and pickle of a resolved plant keep its schedule intact and read-only."""
+    config = {"species": SPECIES, "plants": [
+        {"id": "a", "name": "Spider A", "location": "Kitchen", "species": "spider_plant"}
+    ]}
+    plant = resolve_species_templates(config)["plants"][0]
+    for clone in (copy.deepcopy(plant), pickle.loads(pickle.dumps(plant))):
+        assert clone == plant
+        assert clone["watering_schedule"]["season_adjustments"]["winter"] == 12
+        try:
+            clone["watering_schedule"]["frequency_days"] = 1
+            assert False, "copied schedule should stay read-only"
+        except TypeError:
+            pass
+    assert copy.copy(plant["watering_schedule"]) is plant["watering_schedule"]
+
+def test_notifier_uses_resolved_schedule():
+    """The notifier computes due dates from inherited schedules."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_file = Path(tmp_dir) / "config.json"
+        config_file.write_text(json.dumps({
+            "species": SPECIES,
+            "plants": [{"id": "a", "name": "Spider A", "location": "Kitchen", "species": "spider_plant"}]
+        }), encoding='utf-8')
+        notifier = PlantWateringNotifier("test_token", "test_chat", config_file=str(config_file),
+                                         log_file=str(Path(tmp_dir) / "log.json"))
+        plant = notifier._load_plant_config()["plants"][0]
+        next_due = notifier._calculate_next_watering_date(plant, "2025-01-01")
+        season = notifier._get_current_season()
+        expected = SPECIES["spider_plant"]["watering_schedule"]["season_adjustments"][season]
+        assert next_due == datetime.date(2025, 1, 1) + datetime.timedelta(days=expected)
+
+def test_csv_import_streams_and_reports_errors():
+    """Valid rows are imported, invalid rows are reported with their line number."""
+    print("🧪 Testing CSV catalog import")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        templates = tmp / "templates.json"
+        templates.write_text(json.dumps({"species": SPECIES, "notification_settings": {"timezone": "UTC"}}),
+                             encoding='utf-8')
+        catalog = tmp / "catalog.csv"
+        with open(catalog, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "name", "location", "species", "frequency_days", "summer", "active"])
+            writer.writerow(["p1", "Spider 1", "Lobby", "spider_plant", "", "", ""])
+            writer.writerow(["p2", "Fern", "Office", "", "5", "3", "false"])
+            writer.writerow(["p3", "Mystery", "Office", "unknown_species", "", "", ""])
+            writer.writerow(["p4", "Broken", "Office", "", "-2", "", ""])
+            writer.writerow(["", "No id", "Office", "spider_plant", "", "", ""])
+            writer.writerow(["p1", "Spider again", "Lobby", "spider_plant", "", "", ""])
+
+        output = tmp / "config.json"
+        errors = tmp / "errors.csv"
+        summary = import_catalog_csv(str(catalog), str(output), str(templates), str(errors),
+                                     check_duplicate_ids=True)
+
+        assert summary["imported"] == 2
+        assert [e["row"] for e in summary["errors"]] == [4, 5, 6, 7]
+        assert len(errors.read_text(encoding='utf-8').strip().splitlines()) == 5
+
+        config = json.loads(output.read_text(encoding='utf-8'))
+        assert config["notification_settings"] == {"timezone": "UTC"}
+        assert config["plants"][0] == {"id": "p1", "name": "Spider 1", "location": "Lobby",
+                                       "species": "spider_plant", "active": True}
+        assert config["plants"][1]["watering_schedule"] == {"frequency_days": 5,
+                                                            "season_adjustments": {"summer": 3}}
+        assert config["plants"][1]["active"] is False
+        resolved = resolve_species_templates(config)["plants"][0]
+        assert resolved["care_notes"] == SPECIES["spider_plant"]["care_notes"]
+    print(f"✅ Imported {summary['imported']} plants, rejected {summary['rejected']} rows")
+
+def test_csv_import_survives_bad_rows_and_bom():
+    """A BOM header is accepted, an oversized cell is a row error and the target is replaced atomically."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        catalog = tmp / "catalog.csv"
+        oversized = "x" * (csv.field_size_limit() + 1)
+        catalog.write_text("id,name,location,frequency_days,care_notes\n"
+                           f"p1,Fern,Office,5,\n"
+                           f"p2,Palm,Office,7,{oversized}\n"
+                           f"p3,Ivy,Office,4,\n", encoding='utf-8-sig')
+        output = tmp / "config.json"
+        output.write_text('{"plants": []}', encoding='utf-8')
+
+        summary = import_catalog_csv(str(catalog), str(output))
+        assert summary["imported"] == 2
+        assert summary["errors"][0]["row"] == 3
+        assert "unreadable row" in summary["errors"][0]["error"]
+        config = json.loads(output.read_text(encoding='utf-8'))
+        assert [p["id"] for p in config["plants"]] == ["p1", "p3"]
+        assert sorted(f.name for f in tmp.iterdir()) == ["catalog.csv", "config.json"]
+
+        # A failing import leaves the existing config untouched
+        try:
+            import_catalog_csv(str(tmp / "missing.csv"), str(output))
+            assert False, "missing catalog should raise"
+        except FileNotFoundError:
+            pass
+        assert [p["id"] for p in json.loads(output.read_text(encoding='utf-8'))["plants"]] == ["p1", "p3"]
+        assert sorted(f.name for f in tmp.iterdir()) == ["catalog.csv", "config.json"]
+
+if __name__ == "__main__":
+    test_species_templates_are_inherited_and_shared()
+    test_resolved_plants_can_be_copied_and_pickled()
+    test_notifier_uses_resolved_schedule()
+    test_csv_import_streams_and_reports_errors()
+    test_csv_import_survives_bad_rows_and_bom()
+    print("\n🎉 All tests completed successfully!")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test script for the watering day coalescing scheduler
+"""
+
+import datetime
+import json
+import tempfile
+from pathlib import Path
+
+from delivery_channels import FileChannel
+from plant_watering_notifier import PlantWateringNotifier
+from watering_scheduler import (plan_visit_days, select_for_today, simulate_watering_days,
+                                watering_window)
+
+DAY = datetime.date(2026, 4, 10)
+SETTINGS = {"tolerance_days": 1, "max_dry_days": None}
+
+def _days(n: int) -> datetime.timedelta:
+    return datetime.timedelta(days=n)
+
+def test_watering_window_limits():
+    """Tolerance widens the window, max-dry caps it."""
+    plant = {"watering_schedule": {"frequency_days": 7}}
+    assert watering_window(plant, DAY - _days(7), DAY, SETTINGS) == (DAY - _days(1), DAY, DAY + _days(1))
+    capped = watering_window(plant, DAY - _days(7), DAY, {"tolerance_days": 2, "max_dry_days": 6})
+    assert capped == (DAY - _days(2), DAY - _days(1), DAY - _days(1))
+
+def test_plan_visit_days_is_minimal_and_keeps_due_dates():
+    """Nearby due dates share a visit, a lone plant keeps its own due date."""
+    print("🧪 Testing visit planning")
+    windows = [(DAY + _days(d) - _days(1), DAY + _days(d), DAY + _days(d) + _days(1)) for d in (0, 1, 2, 3, 10)]
+    visits = plan_visit_days(windows)
+    assert len(visits) == 3
+    assert visits[-1] == DAY + _days(10)
+    for start, _, end in windows:
+        assert any(start <= visit <= end for visit in visits)
+    print(f"✅ 5 due dates planned into {len(visits)} visits")
+
+def _coalescing_notifier(tmp: Path, plants: list, days_since_watered: dict,
+                         channels: list = None, coalescing: bool = True,
+                         skip_runs: bool = False) -> PlantWateringNotifier:
+    """Notifier with each plant last watered the given days ago, coalescing on by default."""
+    config_file = tmp / "config.json"
+    config_file.write_text(json.dumps({
+        "plants": plants,
+        "notification_settings": {
+            "watering_day_coalescing": {"enabled": coalescing, "tolerance_days": 1},
+            "skip_runs_without_watering": skip_runs
+        }
+    }), encoding='utf-8')
+    today = datetime.date.today()
+    log_file = tmp / "log.json"
+    log_file.write_text(json.dumps({"metadata": {}, "watering_events": [{
+        "status": "success",
+        "plants_watered": [{"plant_id": pid, "watered_date": (today - _days(n)).isoformat()}
+                           for pid, n in days_since_watered.items()]
+    }]}), encoding='utf-8')
+    return PlantWateringNotifier("test_token", "test_chat", config_file=str(config_file),
+                                 log_file=str(log_file), channels=channels)
+
+def _plant(plant_id: str, location: str, frequency: int = 7) -> dict:
+    return {"id": plant_id, "name": plant_id.title(), "location": location,
+            "watering_schedule": {"frequency_days": frequency}}
+
+def test_notifier_coalesces_by_location():
+    """With coalescing on, a plant due tomorrow joins today's visit at the same location only."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        notifier = _coalescing_notifier(
+            Path(tmp_dir),
+            [_plant("due", "Lobby"), _plant("early", "Lobby"), _plant("elsewhere", "Roof")],
+            {"due": 7, "early": 6, "elsewhere": 6})
+        due_today, overdue, upcoming = notifier._get_plants_needing_water()
+        assert sorted(p["id"] for p in due_today) == ["due", "early"]
+        assert overdue == []
+        assert [p["id"] for p in upcoming] == ["elsewhere"]
+
+def test_deferred_plant_is_not_reported_overdue():
+    """A plant moved past its due date is due today, not overdue, while inside its window."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Day 1 of: A due yesterday, B due tomorrow, both at the Lobby
+        notifier = _coalescing_notifier(Path(tmp_dir), [_plant("a", "Lobby"), _plant("b", "Lobby")],
+                                        {"a": 8, "b": 6})
+        due_today, overdue, _ = notifier._get_plants_needing_water()
+        assert sorted(p["id"] for p in due_today) == ["a", "b"]
+        assert overdue == []
+
+def test_window_never_opens_on_watering_day():
+    """With tolerance >= frequency, a plant watered today isn't selected again today."""
+    plant = {"watering_schedule": {"frequency_days": 2, "tolerance_days": 2}}
+    start, _, end = watering_window(plant, DAY, DAY + _days(2), SETTINGS)
+    assert start == DAY + _days(1) and end == DAY + _days(4)
+    assert select_for_today({"p": (start, DAY + _days(2), end)}, DAY) == []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fast = _plant("fast", "Lobby", frequency=2)
+        fast["watering_schedule"]["tolerance_days"] = 2
+        notifier = _coalescing_notifier(Path(tmp_dir), [fast], {"fast": 0})
+        due_today, overdue, _ = notifier._get_plants_needing_water()
+        assert due_today == [] and overdue == []
+
+def test_no_message_on_days_without_a_visit():
+    """Runs with nothing to water send nothing only when skip_runs_without_watering is set."""
+    for coalescing in (True, False):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            output = tmp / "reminders.txt"
+            notifier = _coalescing_notifier(tmp, [_plant("fern", "Lobby")], {"fern": 3},
+                                            channels=[FileChannel(str(output))],
+                                            coalescing=coalescing, skip_runs=True)
+            assert notifier.send_watering_reminder()
+            assert notifier.reminder_skipped
+            assert not output.exists()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        output = tmp / "reminders.txt"
+        # Coalescing alone keeps the usual "Coming Up" message
+        notifier = _coalescing_notifier(tmp, [_plant("fern", "Lobby")], {"fern": 6},
+                                        channels=[FileChannel(str(output))])
+        assert notifier.send_watering_reminder()
+        assert not notifier.reminder_skipped
+        assert "Coming Up" in output.read_text(encoding='utf-8')
+
+def test_simulation_reports_savings():
+    """Plants with drifting frequencies at one site need fewer visits when coalesced."""
+    print("🧪 Testing savings report")
+    plants = [{"id": f"p{i}", "location": "Site", "watering_schedule": {"frequency_days": f}}
+              for i, f in enumerate([5, 6, 7, 8])]
+    history = {plant["id"]: DAY for plant in plants}
+    report = simulate_watering_days(plants, history, DAY, 56, SETTINGS, runs_per_day=2)
+    assert report["coalesced_visits"] < report["per_plant_visits"]
+    assert report["visits_saved"] == report["per_plant_visits"] - report["coalesced_visits"]
+    # By default every run sends; skipping runs without watering leaves one message per visit
+    # day (one site, so per visit), and coalescing then saves the rest on top of that
+    assert report["runs"] == 56 * 2
+    assert report["per_plant_messages"] == report["per_plant_visits"]
+    assert report["coalesced_messages"] == report["coalesced_visits"]
+    assert report["messages_saved_by_skipping"] == report["runs"] - report["per_plant_messages"]
+    assert report["messages_saved_by_coalescing"] == report["visits_saved"] > 0
+    print(f"✅ Saved {report['visits_saved']} visits, {report['messages_saved_by_skipping']} messages "
+          f"by skipping and {report['messages_saved_by_coalescing']} by coalescing")
+
+if __name__ == "__main__":
+    test_watering_window_limits()
+    test_plan_visit_days_is_minimal_and_keeps_due_dates()
+    test_notifier_coalesces_by_location()
+    test_deferred_plant_is_not_reported_overdue()
+    test_window_never_opens_on_watering_day()
+    test_no_message_on_days_without_a_visit()
+    test_simulation_reports_savings()
+    print("\n🎉 All tests completed successfully!")
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Watering Day Coalescing Scheduler
+Groups nearby due dates at the same location into as few watering days as
+possible, within per-plant tolerance windows and never beyond a max-dry limit.
+"""
+
+import argparse
+import datetime
+from collections import defaultdict
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Hashable
+
+DEFAULT_TOLERANCE_DAYS = 1
+
+Window = Tuple[datetime.date, datetime.date, datetime.date]
+
+
+def season_for_date(day: datetime.date) -> str:
+    """Determine the season for a given date based on the month."""
+    if day.month in [3, 4, 5]:
+        return "spring"
+    elif day.month in [6, 7, 8]:
+        return "summer"
+    elif day.month in [9, 10, 11]:
+        return "autumn"
+    else:
+        return "winter"
+
+
+def frequency_for_season(plant: Dict[str, Any], season: str) -> int:
+    """Watering frequency in days for a plant in the given season."""
+    schedule = plant.get("watering_schedule", {})
+    season_adjustments = schedule.get("season_adjustments", {})
+    return season_adjustments.get(season, schedule.get("frequency_days", 7))
+
+
+def coalescing_settings(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Read the `watering_day_coalescing` block of `notification_settings`.
+
+    Returns:
+        dict with tolerance_days and max_dry_days, or None when coalescing is disabled
+    """
+    settings = config.get("notification_settings", {}).get("watering_day_coalescing", {})
+    if not settings.get("enabled", False):
+        return None
+    return {
+        "tolerance_days": settings.get("tolerance_days", DEFAULT_TOLERANCE_DAYS),
+        "max_dry_days": settings.get("max_dry_days")
+    }
+
+
+def skip_runs_without_watering(config: Dict[str, Any]) -> bool:
+    """
+    Read the `skip_runs_without_watering` flag of `notification_settings`.
+
+    When set, runs with no plant due or overdue send nothing, so the
+    "Coming Up" and "all plants happy" messages are no longer sent.
+    """
+    return bool(config.get("notification_settings", {}).get("skip_runs_without_watering", False))
+
+
+def watering_window(plant: Dict[str, Any], last_watered: datetime.date,
+                    next_due: datetime.date, settings: Dict[str, Any]) -> Window:
+    """
+    Days on which a plant may be watered instead of exactly on its due date.
+
+    The window spans `tolerance_days` either side of the due date and is cut
+    off at `max_dry_days` after the last watering. It never opens before the
+    day after the last watering, so a plant isn't watered twice in one day.
+    Both limits can be set per plant in its `watering_schedule`, overriding
+    the global settings.
+
+    Returns:
+        Tuple of (earliest, preferred, latest) watering dates
+    """
+    schedule = plant.get("watering_schedule", {})
+    tolerance = schedule.get("tolerance_days", settings["tolerance_days"])
+    max_dry_days = schedule.get("max_dry_days", settings.get("max_dry_days"))
+
+    day_after_watering = last_watered + datetime.timedelta(days=1)
+    earliest = max(next_due - datetime.timedelta(days=tolerance), day_after_watering)
+    latest = next_due + datetime.timedelta(days=tolerance)
+    if max_dry_days is not None:
+        latest = min(latest, last_watered + datetime.timedelta(days=max_dry_days))
+    latest = max(latest, day_after_watering)
+    earliest = min(earliest, latest)
+    return earliest, min(max(next_due, earliest), latest), latest
+
+
+def plan_visit_days(windows: Iterable[Window], earliest: Optional[datetime.date] = None) -> List[datetime.date]:
+    """
+    Choose the fewest days such that every window contains at least one of them.
+
+    Greedy interval stabbing: take the uncovered window that closes first; a
+    visit before it closes covers every window already open by then, which
+    gives the minimum number of visits. Within the range that covers the same
+    group, the visit goes as close as possible to the preferred date of that
+    first window, so a plant alone at its location is still watered on its due
+    date. Sorting dominates, so this runs in O(n log n).
+
+    Args:
+        windows: (earliest, preferred, latest) dates for the plants of one location
+        earliest (date): Optional first allowed visit day, windows are clamped to it
+
+    Returns:
+        Sorted list of visit days
+    """
+    items = list(windows)
+    if earliest is not None:
+        items = [tuple(max(day, earliest) for day in window) for window in items]
+    by_end = sorted(range(len(items)), key=lambda i: items[i][2])
+    by_start = sorted(range(len(items)), key=lambda i: items[i][0])
+    covered = [False] * len(items)
+    next_start = 0
+    visits: List[datetime.date] = []
+
+    for i in by_end:
+        if covered[i]:
+            continue
+        close = items[i][2]
+        latest_open = items[i][0]
+        # Windows are covered in start order, so the uncovered ones are a suffix of by_start
+        while next_start < len(by_start) and items[by_start[next_start]][0] <= close:
+            covered[by_start[next_start]] = True
+            latest_open = items[by_start[next_start]][0]
+            next_start += 1
+        visits.append(min(max(items[i][1], latest_open), close))
+    return visits
+
+
+def select_for_today(windows: Dict[Hashable, Window], today: datetime.date) -> List[Hashable]:
+    """
+    Decide which plants of one location to water today.
+
+    A visit happens today only if it is the first day of the location's
+    `plan_visit_days` plan; it then covers every plant whose window is open.
+
+    Args:
+        windows: Mapping of plant key to its (earliest, preferred, latest) window
+        today (date): Current day
+
+    Returns:
+        Keys of the plants to water today (empty when no visit is needed)
+    """
+    plan = plan_visit_days(windows.values(), earliest=today)
+    if not plan or plan[0] > today:
+        return []
+    return [key for key, (start, _, _) in windows.items() if start <= today]
+
+
+def simulate_watering_days(plants: List[Dict[str, Any]], last_watered: Dict[str, datetime.date],
+                           start_day: datetime.date, days: int,
+                           settings: Dict[str, Any], runs_per_day: int = 1) -> Dict[str, Any]:
+    """
+    Compare per-plant watering with coalesced watering over a period.
+
+    Both policies start from the same watering history and assume a plant is
+    watered on the day it is reminded, like the notifier does. A visit is one
+    location watered on one day.
+
+    Messages are reported in three steps so each setting's share is visible:
+    `runs` is what the notifier sends by default, one message per run with
+    or without coalescing. With `skip_runs_without_watering` it only sends on
+    days with a visit (later runs that day find everything watered), which
+    gives `per_plant_messages` and, with coalescing too, `coalesced_messages`.
+
+    Args:
+        runs_per_day (int): How often the notifier runs per day (the workflow runs twice)
+
+    Returns:
+        dict with visit and message counts and the savings of each setting
+    """
+    active = [p for p in plants if p.get("active", True)]
+    report: Dict[str, Any] = {"days": days, "plants": len(active), "runs": days * runs_per_day}
+
+    for policy in ("per_plant", "coalesced"):
+        state = dict(last_watered)
+        visits = 0
+        messages = 0
+        for offset in range(days):
+            today = start_day + datetime.timedelta(days=offset)
+            season = season_for_date(today)
+            by_location: Dict[str, Dict[str, Window]] = defaultdict(dict)
+            for plant in active:
+                last = state.get(plant["id"])
+                if last is None:
+                    by_location[plant.get("location", "")][plant["id"]] = (today, today, today)
+                    continue
+                next_due = last + datetime.timedelta(days=frequency_for_season(plant, season))
+                if policy == "per_plant":
+                    by_location[plant.get("location", "")][plant["id"]] = (next_due, next_due, next_due)
+                else:
+                    by_location[plant.get("location", "")][plant["id"]] = watering_window(
+                        plant, last, next_due, settings)
+
+            watered_today = False
+            for windows in by_location.values():
+                if policy == "per_plant":
+                    watered = [key for key, (_, due, _) in windows.items() if due <= today]
+                else:
+                    watered = select_for_today(windows, today)
+                if watered:
+                    visits += 1
+                    watered_today = True
+                    for plant_id in watered:
+                        state[plant_id] = today
+            messages += watered_today
+
+        report[f"{policy}_visits"] = visits
+        report[f"{policy}_messages"] = messages
+
+    report["visits_saved"] = report["per_plant_visits"] - report["coalesced_visits"]
+    report["messages_saved_by_skipping"] = report["runs"] - report["per_plant_messages"]
+    report["messages_saved_by_coalescing"] = report["per_plant_messages"] - report["coalesced_messages"]
+    return report
+
+
+def main():
+    """Report how many visits and messages coalescing and skipping would save."""
+    parser = argparse.ArgumentParser(description="Estimate savings from coalescing watering days")
+    parser.add_argument("--config", default="plant_config.json")
+    parser.add_argument("--log", default="notifications_log.json")
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--tolerance", type=int, default=None, help="override tolerance_days")
+    parser.add_argument("--max-dry", type=int, default=None, help="override max_dry_days")
+    parser.add_argument("--runs-per-day", type=int, default=2,
+                        help="notifier runs per day (the GitHub workflow runs twice)")
+    args = parser.parse_args()
+
+    # Imported here to avoid a circular import, the notifier uses this module
+    from plant_watering_notifier import PlantWateringNotifier
+
+    notifier = PlantWateringNotifier("report_token", "report_chat",
+                                     config_file=args.config, log_file=args.log)
+    config = notifier._load_plant_config()
+    settings = coalescing_settings(config) or {"tolerance_days": DEFAULT_TOLERANCE_DAYS,
+                                               "max_dry_days": None}
+    if args.tolerance is not None:
+        settings["tolerance_days"] = args.tolerance
+    if args.max_dry is not None:
+        settings["max_dry_days"] = args.max_dry
+
+    history = {
+        plant_id: datetime.datetime.strptime(date, "%Y-%m-%d").date()
+        for plant_id, date in notifier._load_watering_history_from_logs().items()
+    }
+    report = simulate_watering_days(config.get("plants", []), history,
+                                    datetime.date.today(), args.days, settings, args.runs_per_day)
+
+    print(f"🗓️ Watering day coalescing over {report['days']} days ({report['plants']} plants)")
+    print(f"   Visits:   {report['per_plant_visits']} per-plant → {report['coalesced_visits']} coalesced "
+          f"(saved {report['visits_saved']})")
+    print(f"   Messages: {report['runs']} sending on every run")
+    print(f"             → {report['per_plant_messages']} with skip_runs_without_watering "
+          f"(saved {report['messages_saved_by_skipping']})")
+    print(f"             → {report['coalesced_messages']} with coalescing as well "
+          f"(saved {report['messages_saved_by_coalescing']})")
+
+if __name__ == "__main__":
+    main()